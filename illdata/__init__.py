@@ -1,4 +1,5 @@
 from .sftp import IllSftp
+from .sftp_async import AsyncIllSftp
 from .exceptions import IllDataError, NotConnectedError, NoProposalSelectedError
 
-__all__ = ["IllSftp", "IllDataError", "NotConnectedError", "NoProposalSelectedError"]
+__all__ = ["IllSftp", "AsyncIllSftp", "IllDataError", "NotConnectedError", "NoProposalSelectedError"]
@@ -1,17 +1,38 @@
 from __future__ import annotations
 
+import errno
+import json
 import logging
 import os
+import posixpath
+import queue
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import PurePosixPath
-from typing import Generator, Optional
+from stat import S_ISLNK
+from typing import Dict, Generator, Iterable, List, Optional, Set, Tuple
 
 import paramiko
+from paramiko.sftp import (
+    CMD_ATTRS, CMD_CLOSE, CMD_DATA, CMD_FSTAT, CMD_HANDLE, CMD_NAME, CMD_OPEN, CMD_READ,
+    CMD_READLINK, CMD_STATUS, SFTP_FLAG_READ, int64,
+)
 
 from .exceptions import IllDataError, NoProposalSelectedError, NotConnectedError
+from .throttle import RateLimitedReader, TokenBucket
 
 log = logging.getLogger(__name__)
 
+_KEEPALIVE_S = 30           # SSH keepalive interval, keeps long transfers alive
+# tried first when prefer_fast_cipher is set (unsupported names are skipped):
+# AES-GCM is AES-NI accelerated, ChaCha20 the fastest without it
+_FAST_CIPHERS = ("aes128-gcm@openssh.com", "chacha20-poly1305@openssh.com", "aes128-ctr")
+_SMALL_FILE_MAX = 1 << 20   # larger files leave the batched path for _get_pipelined
+_SMALL_READ = 32768         # READ size used by the batched small-file path
+_MTIME_SLACK_S = 2          # dirs changed more recently are not persisted (1 s mtimes)
+
 
 def _join_posix(*parts: str) -> str:
     """Safely join POSIX paths (Paramiko SFTP paths are always POSIX)."""
@@ -21,6 +42,262 @@ def _join_posix(*parts: str) -> str:
     return str(p)
 
 
+def _fast_cipher_transport(sock, **kwargs) -> paramiko.Transport:
+    """``transport_factory`` for :meth:`paramiko.SSHClient.connect` preferring fast ciphers."""
+    t = paramiko.Transport(sock, **kwargs)
+    sec = t.get_security_options()
+    current = sec.ciphers
+    sec.ciphers = [c for c in _FAST_CIPHERS if c in current] + [
+        c for c in current if c not in _FAST_CIPHERS
+    ]
+    return t
+
+
+def _throttle_callback(bucket: Optional[TokenBucket]):
+    """Paramiko progress callback charging each transferred block to *bucket*."""
+    if bucket is None:
+        return None
+    done = 0
+
+    def callback(transferred: int, total: int) -> None:
+        nonlocal done
+        bucket.consume(transferred - done)
+        done = transferred
+
+    return callback
+
+
+def _get_pipelined(sftp: paramiko.SFTPClient, remote: str, local: str,
+                   bucket: Optional[TokenBucket] = None) -> None:
+    """
+    Download *remote* to *local* with read-ahead.
+
+    ``prefetch=True`` keeps many READ requests in flight instead of paying
+    one round-trip per block, so a single large file can fill the link.
+    """
+    sftp.get(remote, local, callback=_throttle_callback(bucket), prefetch=True)
+
+
+def _put_pipelined(sftp: paramiko.SFTPClient, local: str, remote: str,
+                   bucket: Optional[TokenBucket] = None) -> None:
+    """Upload *local* to *remote*; ``putfo`` issues pipelined (unacknowledged) WRITEs."""
+    with open(local, "rb") as fl:
+        size = os.fstat(fl.fileno()).st_size
+        src = fl if bucket is None else RateLimitedReader(fl, bucket)
+        # confirm=False: skip the STAT round-trip paramiko would do afterwards
+        sftp.putfo(src, remote, file_size=size, confirm=False)
+
+
+class _Responses:
+    """Sink for replies to requests sent with ``SFTPClient._async_request``."""
+
+    def __init__(self) -> None:
+        self.ready: Dict[int, Tuple[int, paramiko.Message]] = {}
+
+    def _async_response(self, t: int, msg: paramiko.Message, num: int) -> None:
+        self.ready[num] = (t, msg)
+
+
+class _Fetch:
+    """State of one file in :func:`_pipelined_small_file_fetch`."""
+
+    def __init__(self, remote: str, local: str, size: Optional[int]) -> None:
+        self.remote = remote
+        self.local = local
+        self.size = size                # known size, else asked for with FSTAT
+        self.handle = b""
+        self.chunks: List[bytes] = []
+        self.offset = 0
+        self.outstanding = 0            # requests awaiting a reply
+        self.too_big = False
+        self.closing = False
+
+
+def _check_status(sftp: paramiko.SFTPClient, msg: paramiko.Message, path: str) -> None:
+    """``_convert_status`` with *path* in the error; ``EOFError`` passes through."""
+    try:
+        sftp._convert_status(msg)
+    except EOFError:
+        raise
+    except IOError as err:
+        if err.errno is not None:
+            raise IOError(err.errno, err.strerror, path) from None
+        raise IOError(f"{path}: {err}") from None
+
+
+def _pipelined_small_file_fetch(
+    sftp: paramiko.SFTPClient, pairs: Iterable[Tuple[str, str]], window: int = 32,
+    bucket: Optional[TokenBucket] = None, sizes: Optional[Dict[str, int]] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Download many small ``(remote, local)`` files with their requests interleaved.
+    Local directories must already exist.
+
+    Each file walks OPEN → READ… → CLOSE with up to *window* files in flight,
+    so the round-trips of one file hide behind those of the others. Files
+    whose size is not in *sizes* (remote path -> bytes) get an FSTAT sent
+    together with their first READ, which costs no extra round-trip. Files
+    larger than ``_SMALL_FILE_MAX`` are returned instead of read; fetch those
+    with :func:`_get_pipelined`. On error, the handles still open are closed
+    before the exception propagates.
+    """
+    sizes = sizes or {}
+    todo = deque(pairs)
+    inflight: Dict[int, Tuple[_Fetch, int]] = {}    # request id -> (file, request type)
+    responses = _Responses()
+    active: Set[_Fetch] = set()         # files with requests in flight
+    open_files: Set[_Fetch] = set()     # files holding a remote handle
+    too_big: List[Tuple[str, str]] = []
+
+    def send(f: _Fetch, t: int, *args) -> None:
+        inflight[sftp._async_request(responses, t, *args)] = (f, t)
+        f.outstanding += 1
+        active.add(f)
+
+    def close(f: _Fetch) -> None:
+        f.closing = True
+        send(f, CMD_CLOSE, f.handle)
+
+    def on_reply(f: _Fetch, req: int, t: int, msg: paramiko.Message) -> None:
+        if req == CMD_OPEN:
+            if t != CMD_HANDLE:
+                _check_status(sftp, msg, f.remote)
+                raise paramiko.SFTPError(f"Unexpected reply to open of {f.remote}")
+            f.handle = msg.get_binary()
+            open_files.add(f)
+            if f.size is None:
+                send(f, CMD_FSTAT, f.handle)    # answered before the READ below
+            send(f, CMD_READ, f.handle, int64(0), _SMALL_READ)
+
+        elif req == CMD_FSTAT:
+            if t != CMD_ATTRS:
+                _check_status(sftp, msg, f.remote)
+                raise paramiko.SFTPError(f"Unexpected reply to fstat of {f.remote}")
+            size = paramiko.SFTPAttributes._from_msg(msg).st_size
+            if size is not None and size > _SMALL_FILE_MAX:
+                f.too_big = True        # the first READ reply then closes it
+
+        elif req == CMD_READ:
+            if t == CMD_DATA:
+                data = msg.get_string()
+                if bucket is not None:
+                    bucket.consume(len(data))
+                f.chunks.append(data)
+                f.offset += len(data)
+                if f.offset > _SMALL_FILE_MAX:
+                    f.too_big = True    # grew past the limit while being read
+                if f.too_big:
+                    close(f)
+                else:
+                    send(f, CMD_READ, f.handle, int64(f.offset), _SMALL_READ)
+            else:
+                try:
+                    _check_status(sftp, msg, f.remote)
+                except EOFError:
+                    close(f)
+                else:
+                    raise paramiko.SFTPError(f"Unexpected reply reading {f.remote}")
+
+        else:  # CMD_CLOSE
+            open_files.discard(f)
+            if t == CMD_STATUS:
+                _check_status(sftp, msg, f.remote)
+
+        if f.closing and f.outstanding == 0:
+            active.discard(f)
+            if f.too_big:
+                too_big.append((f.remote, f.local))
+                return
+            with open(f.local, "wb") as fl:
+                fl.write(b"".join(f.chunks))
+            log.info("Downloaded %s → %s", f.remote, f.local)
+
+    try:
+        while todo or inflight:
+            while todo and len(active) < window:
+                remote, local = todo.popleft()
+                size = sizes.get(remote)
+                if size is not None and size > _SMALL_FILE_MAX:
+                    too_big.append((remote, local))
+                else:
+                    f = _Fetch(remote, local, size)
+                    send(f, CMD_OPEN, f.remote, SFTP_FLAG_READ, paramiko.SFTPAttributes())
+            if not inflight:
+                continue                # everything left was too big to batch
+
+            sftp._read_response()          # one reply, dispatched to `responses`
+            while responses.ready:
+                num, (t, msg) = responses.ready.popitem()
+                f, req = inflight.pop(num)
+                f.outstanding -= 1
+                on_reply(f, req, t, msg)
+    finally:
+        if inflight or open_files:
+            _close_abandoned(sftp, responses, inflight, open_files)
+
+    return too_big
+
+
+def _close_abandoned(sftp: paramiko.SFTPClient, responses: _Responses,
+                     inflight: Dict[int, Tuple[_Fetch, int]], open_files: Set[_Fetch]) -> None:
+    """Best effort: wait out *inflight* requests and CLOSE every handle left open."""
+    try:
+        pending = set(inflight)
+        for f in open_files:
+            if not f.closing:
+                f.closing = True
+                pending.add(sftp._async_request(responses, CMD_CLOSE, f.handle))
+        while True:
+            while responses.ready:      # may hold replies received before the error
+                num, (t, msg) = responses.ready.popitem()
+                pending.discard(num)
+                if num in inflight and inflight[num][1] == CMD_OPEN and t == CMD_HANDLE:
+                    # late OPEN reply: close the handle it just created
+                    pending.add(sftp._async_request(responses, CMD_CLOSE, msg.get_binary()))
+            if not pending:
+                break
+            sftp._read_response()
+    except Exception as err:                       # noqa: BLE001
+        log.debug("Could not close abandoned handles: %s", err)
+
+
+def _readlink_many(sftp: paramiko.SFTPClient, paths: List[str],
+                   window: int = 64) -> List[Optional[str]]:
+    """``readlink`` of many *paths* with up to *window* requests in flight (``None`` on error)."""
+    todo = deque(enumerate(paths))
+    inflight: Dict[int, int] = {}       # request id -> index into paths
+    responses = _Responses()
+    targets: List[Optional[str]] = [None] * len(paths)
+
+    while todo or inflight:
+        while todo and len(inflight) < window:
+            i, path = todo.popleft()
+            inflight[sftp._async_request(responses, CMD_READLINK, path)] = i
+
+        sftp._read_response()
+        while responses.ready:
+            num, (t, msg) = responses.ready.popitem()
+            i = inflight.pop(num)
+            if t == CMD_NAME and msg.get_int() == 1:
+                targets[i] = msg.get_text()
+    return targets
+
+
+def _user_cache_dir() -> str:
+    """Per-user cache directory for illdata (XDG on POSIX, LOCALAPPDATA on Windows)."""
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~/AppData/Local")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "illdata")
+
+
+def _chunk(items: List[Tuple[str, str]], n: int) -> List[List[Tuple[str, str]]]:
+    """Split *items* into at most *n* round-robin groups (empty groups dropped)."""
+    groups = [items[i::n] for i in range(max(1, n))]
+    return [g for g in groups if g]
+
+
 @dataclass
 class IllSftp:
     """
@@ -35,6 +312,7 @@ class IllSftp:
     ...         print(p)
     ...     s.open_proposal("12345")
     ...     s.download("remote/file.dat", "local/file.dat")
+    ...     s.download_many([("a.dat", "local/a.dat"), ("b.dat", "local/b.dat")])
     """
 
     hostname: str
@@ -42,12 +320,37 @@ class IllSftp:
     password: str
     port: int = 22
     known_hosts_path: Optional[str] = None  # optional file for strict host-key checking
-
+    cache_ttl: float = 30.0                 # seconds a cached directory listing stays valid
+    rate_limit_bps: Optional[float] = None  # cap on transfer rate in bytes/s (None = unlimited)
+    persist_cache: bool = False             # keep listed names on disk across sessions
+    prefer_fast_cipher: bool = True         # negotiate AES-128 before AES-256 etc.
+
+    _bucket: Optional[TokenBucket] = field(default=None, init=False, repr=False)
+    _host_keys: Optional[paramiko.HostKeys] = field(default=None, init=False, repr=False)
+    _proposal_targets: Optional[Dict[str, str]] = field(default=None, init=False, repr=False)
+    _client: Optional[paramiko.SSHClient] = field(default=None, init=False, repr=False)
     _transport: Optional[paramiko.Transport] = field(default=None, init=False, repr=False)
     _sftp: Optional[paramiko.SFTPClient] = field(default=None, init=False, repr=False)
+    _list_sftp: Optional[paramiko.SFTPClient] = field(default=None, init=False, repr=False)
+    _list_busy: bool = field(default=False, init=False, repr=False)
     _home: str = field(default="", init=False, repr=False)
     _proposal: str = field(default="", init=False, repr=False)
     _propdir: str = field(default="", init=False, repr=False)
+    _propdir_prefix: str = field(default="", init=False, repr=False)
+    # absolute remote dir -> (monotonic timestamp, listing)
+    _dir_cache: Dict[str, Tuple[float, List[paramiko.SFTPAttributes]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # persisted names of the open proposal: absolute remote dir -> (dir mtime, names)
+    _disk_entries: Dict[str, Tuple[float, List[str]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _disk_dirty: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.rate_limit_bps is not None:
+            # one bucket for the whole client, so parallel workers share the cap
+            self._bucket = TokenBucket(self.rate_limit_bps)
 
     # ------------------------------------------------------------------ context
     def __enter__(self) -> "IllSftp":
@@ -76,45 +379,79 @@ class IllSftp:
             return
 
         try:
-            # --- SSH client --------------------------------------------------
-            client = paramiko.SSHClient()
-
-            if self.known_hosts_path:
-                client.load_host_keys(self.known_hosts_path)
-                client.set_missing_host_key_policy(paramiko.RejectPolicy())  # strict check
-            else:
-                # SECURITY: auto-add unknown host keys (less secure, but compatible)
-                client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-
-            client.connect(
-                hostname=self.hostname,
-                port=self.port,
-                username=self.username,
-                password=self.password,
-                look_for_keys=False,
-                allow_agent=False,
-            )
+            client = self._open_client()
 
             # keep references so we can close them later
+            self._client = client
             self._transport = client.get_transport()
             self._sftp = client.open_sftp()
 
             # resolve MyData symlink
             self._home = self._sftp.readlink("MyData")
+            self._proposal_targets = None
             log.info("Connected to %s as %s, home=%s", self.hostname, self.username, self._home)
 
         except Exception as err:                       # noqa: BLE001
             self.disconnect()
-            raise IllDataError(f"Cannot connect to SFTP: {err}") from err    
+            raise IllDataError(f"Cannot connect to SFTP: {err}") from err
+
+    def _open_client(self) -> paramiko.SSHClient:
+        """Create and authenticate a new :class:`paramiko.SSHClient`."""
+        client = paramiko.SSHClient()
+
+        if self.known_hosts_path:
+            if self._host_keys is None:
+                # parse known_hosts once per instance, reused on every reconnect
+                self._host_keys = paramiko.HostKeys(self.known_hosts_path)
+            known = client.get_host_keys()
+            for host in self._host_keys.keys():
+                for keytype, key in self._host_keys[host].items():
+                    known.add(host, keytype, key)
+            client.set_missing_host_key_policy(paramiko.RejectPolicy())  # strict check
+        else:
+            # SECURITY: auto-add unknown host keys (less secure, but compatible)
+            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+
+        client.connect(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            look_for_keys=False,
+            allow_agent=False,
+            compress=False,  # data is mostly already compressed (HDF5/NeXus)
+            transport_factory=_fast_cipher_transport if self.prefer_fast_cipher else None,
+        )
+        client.get_transport().set_keepalive(_KEEPALIVE_S)
+        return client
+
+    def _spawn_channel(self) -> paramiko.SFTPClient:
+        """
+        Open an extra SFTP channel on the already authenticated SSH transport.
+
+        Paramiko's :class:`~paramiko.SFTPClient` is not safe to share between
+        threads, but its :class:`~paramiko.Transport` is, so every worker of
+        :py:meth:`download_many` / :py:meth:`upload_many` gets its own channel
+        without another key exchange and login. ``_propdir`` is an absolute
+        path resolved once by :py:meth:`open_proposal`, so it is valid as-is.
+        """
+        if self._transport is None:
+            raise NotConnectedError("Call connect() first or use a with-block.")
+        return paramiko.SFTPClient.from_transport(self._transport)
 
     def disconnect(self) -> None:
         """Close SFTP session and SSH transport."""
+        self._save_disk_cache()
+        self._close_listing_channel()
         if self._sftp:
             self._sftp.close()
             self._sftp = None
         if self._transport:
             self._transport.close()
             self._transport = None
+        if self._client:
+            self._client.close()
+            self._client = None
         if self.connected is False:
             log.info("Disconnected from %s", self.hostname)
 
@@ -128,18 +465,101 @@ class IllSftp:
         if not self._proposal:
             raise NoProposalSelectedError("Open a proposal first: open_proposal('12345').")
 
+    def _remote(self, remote_path: str) -> str:
+        """
+        Absolute remote path of `remote_path` (relative to the proposal root).
+
+        Same result as ``_join_posix(self._propdir, remote_path)``: empty and
+        ``.`` segments are dropped (``"sub/."`` == ``"sub"``) and an absolute
+        `remote_path` is used as-is. Relative paths, the case that runs once
+        per file in bulk transfers, skip the :class:`PurePosixPath` round-trip.
+        """
+        if remote_path.startswith("/"):
+            return _join_posix(remote_path)
+        parts = [p for p in remote_path.split("/") if p and p != "."]
+        if not parts:
+            return self._propdir
+        return self._propdir_prefix + "/".join(parts)
+
     # ------------------------------------------------------------------ API
     def proposals(self) -> Generator[str, None, None]:
         """Yield IDs of all available proposals (strip ``exp_`` prefix)."""
-        sftp = self._require_sftp()
-        for name in sftp.listdir(_join_posix(self._home, "byProposal")):
-            yield name[4:] if name.startswith("exp_") else name
+        self._require_sftp()
+        remote_path = _join_posix(self._home, "byProposal")
+        # Stream READDIR pages as they arrive instead of buffering the listing.
+        # listdir_iter reads replies while this generator is suspended, so it
+        # runs on a channel of its own: calls the caller makes inside the loop
+        # would otherwise consume its replies and block it forever.
+        nested = self._list_busy
+        sftp = self._spawn_channel() if nested else self._listing_channel()
+        self._list_busy = True
+        done = False
+        try:
+            attrs: List[paramiko.SFTPAttributes] = []
+            for attr in sftp.listdir_iter(remote_path):
+                attrs.append(attr)
+                yield attr.filename.removeprefix("exp_")
+            done = True
+        finally:
+            if nested:
+                sftp.close()
+            else:
+                self._list_busy = False
+                if not done:
+                    # an abandoned listdir_iter leaves replies and a handle behind
+                    self._close_listing_channel()
+        self._dir_cache[remote_path] = (time.monotonic(), attrs)
+
+    def _listing_channel(self) -> paramiko.SFTPClient:
+        """
+        Channel for streamed listings, opened on first use and kept until
+        :py:meth:`disconnect`, so later listings skip the channel setup.
+        """
+        if self._list_sftp is None:
+            self._list_sftp = self._spawn_channel()
+        return self._list_sftp
+
+    def _close_listing_channel(self) -> None:
+        if self._list_sftp is not None:
+            self._list_sftp.close()
+            self._list_sftp = None
 
     def open_proposal(self, value: str) -> None:
         """Select a proposal (e.g. ``'12345'``)."""
         sftp = self._require_sftp()
+        self._save_disk_cache()
+        byproposal = _join_posix(self._home, "byProposal")
+        # map all proposals at once when browsing (a fresh listing is cached or
+        # this is not the first proposal); a one-off open costs a single readlink
+        hit = self._dir_cache.get(byproposal)
+        listed = hit is not None and time.monotonic() - hit[0] < self.cache_ttl
+        if self._proposal_targets is None and (self._proposal or listed):
+            self._proposal_targets = self._resolve_proposals(byproposal)
+        target = (self._proposal_targets or {}).get(value)
+        if target is None:
+            target = sftp.readlink(_join_posix(byproposal, "exp_" + value))
         self._proposal = value
-        self._propdir = sftp.readlink(_join_posix(self._home, "byProposal", "exp_" + value))
+        self._propdir = target
+        self._propdir_prefix = self._propdir.rstrip("/") + "/"
+        self._dir_cache.clear()
+        self._load_disk_cache()
+
+    def _resolve_proposals(self, byproposal: str) -> Dict[str, str]:
+        """Map proposal ID -> directory for everything in *byproposal* (batched readlinks)."""
+        sftp = self._require_sftp()
+        attrs = self._list_attrs(byproposal)
+        targets: Dict[str, str] = {}
+        links: List[paramiko.SFTPAttributes] = []
+        for attr in attrs:
+            if attr.st_mode is not None and S_ISLNK(attr.st_mode):
+                links.append(attr)
+            else:
+                targets[attr.filename.removeprefix("exp_")] = _join_posix(byproposal, attr.filename)
+        paths = [_join_posix(byproposal, a.filename) for a in links]
+        for attr, target in zip(links, _readlink_many(sftp, paths)):
+            if target is not None:
+                targets[attr.filename.removeprefix("exp_")] = target
+        return targets
 
     # ------------- list --------------------------------------------------
     def listdir(self, remote_path: str = ".", with_attr: bool = False):
@@ -154,21 +574,233 @@ class IllSftp:
             If ``True`` return :class:`paramiko.SFTPAttributes` objects.
         """
         self._require_proposal()
-        sftp = self._require_sftp()
-        full = _join_posix(self._propdir, remote_path)
-        return sftp.listdir_attr(full) if with_attr else sftp.listdir(full)
+        full = self._remote(remote_path)
+        if not with_attr:
+            return self._list_names(full)
+        return list(self._list_attrs(full))
 
     def listdir_attr(self, remote_path: str = "."):
         """Alias for :py:meth:`listdir(..., with_attr=True)`."""
         return self.listdir(remote_path, with_attr=True)
 
+    def stat(self, remote_path: str) -> paramiko.SFTPAttributes:
+        """
+        Return attributes of `remote_path` (inside the proposal).
+
+        Served from the cached listing of the parent directory, so stat-ing
+        files right after listing them costs no extra round-trip. Like
+        ``listdir_attr``, symlinks are reported as links, not followed.
+        """
+        self._require_proposal()
+        full = self._remote(remote_path)
+        if full == self._propdir:
+            return self._require_sftp().stat(full)
+        parent, name = posixpath.split(full)
+        for attr in self._list_attrs(parent):
+            if attr.filename == name:
+                return attr
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), remote_path)
+
+    def refresh(self, remote_path: Optional[str] = None) -> None:
+        """Drop the cached listing of `remote_path`, or of everything if ``None``."""
+        if remote_path is None:
+            self._dir_cache.clear()
+            self._disk_entries.clear()
+        else:
+            self._dir_cache.pop(self._remote(remote_path), None)
+            self._disk_entries.pop(self._remote(remote_path), None)
+        self._disk_dirty = True
+
+    def _list_attrs(self, full: str) -> List[paramiko.SFTPAttributes]:
+        """``listdir_attr`` of absolute path *full*, cached for :py:attr:`cache_ttl` seconds."""
+        hit = self._dir_cache.get(full)
+        if hit is not None and time.monotonic() - hit[0] < self.cache_ttl:
+            return hit[1]
+        sftp = self._require_sftp()
+        if not self._persists(full):
+            attrs = sftp.listdir_attr(full)
+        else:
+            # stat *before* listing, so a change racing the listing leaves a
+            # stale mtime behind and the entry is re-listed next time
+            mtime = sftp.stat(full).st_mtime
+            attrs = sftp.listdir_attr(full)
+            self._remember_names(full, mtime, attrs)
+        self._dir_cache[full] = (time.monotonic(), attrs)
+        return attrs
+
+    def _list_names(self, full: str) -> List[str]:
+        """
+        Names in absolute path *full*. Names persisted by an earlier session
+        are reused when one ``stat`` shows the directory's mtime unchanged;
+        attributes are never served from disk, they go stale without the
+        directory's mtime changing.
+        """
+        hit = self._dir_cache.get(full)
+        stored = self._disk_entries.get(full)
+        if (hit is None or time.monotonic() - hit[0] >= self.cache_ttl) \
+                and stored is not None and self._persists(full):
+            mtime = self._require_sftp().stat(full).st_mtime
+            if stored[0] == mtime:
+                return list(stored[1])
+            self._disk_entries.pop(full)
+            self._disk_dirty = True
+        return [a.filename for a in self._list_attrs(full)]
+
+    def _persists(self, full: str) -> bool:
+        in_proposal = full == self._propdir or full.startswith(self._propdir_prefix)
+        return self.persist_cache and bool(self._proposal) and in_proposal
+
+    def _remember_names(self, full: str, mtime: Optional[int],
+                        attrs: List[paramiko.SFTPAttributes]) -> None:
+        # mtimes have 1 s resolution: a change within the same second as the
+        # listing would go unnoticed, so recently modified dirs are not kept
+        # (this relies on the client and server clocks roughly agreeing)
+        if mtime is None or time.time() - mtime < _MTIME_SLACK_S:
+            self._disk_entries.pop(full, None)
+        else:
+            self._disk_entries[full] = (mtime, [a.filename for a in attrs])
+        self._disk_dirty = True
+
+    def _disk_cache_path(self) -> str:
+        name = self._proposal.replace("/", "_").replace(os.sep, "_")
+        return os.path.join(_user_cache_dir(), self.hostname, name + ".json")
+
+    def _load_disk_cache(self) -> None:
+        """
+        Load names listed in the open proposal by an earlier session.
+
+        Entries are only trusted after one ``stat`` confirms the directory's
+        mtime (see :py:meth:`_list_names`), which is still cheaper than the
+        OPENDIR/READDIR/CLOSE sequence of a fresh listing.
+        """
+        self._disk_entries = {}
+        self._disk_dirty = False
+        if not self.persist_cache:
+            return
+        try:
+            with open(self._disk_cache_path(), encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("propdir") == self._propdir:
+                self._disk_entries = {d: (mtime, list(names))
+                                      for d, (mtime, names) in data["names"].items()}
+        except FileNotFoundError:
+            pass
+        except Exception as err:                       # noqa: BLE001
+            log.debug("Ignoring unreadable listing cache: %s", err)
+
+    def _save_disk_cache(self) -> None:
+        """Write names listed in the open proposal back to disk if they changed."""
+        if not (self.persist_cache and self._proposal and self._disk_dirty):
+            return
+        path = self._disk_cache_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump({"propdir": self._propdir, "names": self._disk_entries}, f)
+            os.replace(path + ".tmp", path)
+            self._disk_dirty = False
+        except Exception as err:                       # noqa: BLE001
+            log.debug("Cannot write listing cache: %s", err)
+
     # ------------- file transfer -----------------------------------------
     def download(self, remote_path: str, local_path: str) -> None:
         """Download `remote_path` (inside the proposal) to `local_path`."""
         self._require_proposal()
         sftp = self._require_sftp()
+        self._download_one(sftp, remote_path, local_path)
+
+    def upload(self, local_path: str, remote_path: str) -> None:
+        """Upload `local_path` to `remote_path` (inside the proposal)."""
+        self._require_proposal()
+        sftp = self._require_sftp()
+        self._upload_one(sftp, local_path, remote_path)
+
+    def download_many(self, pairs: Iterable[Tuple[str, str]], concurrency: int = 8) -> None:
+        """
+        Download many ``(remote_path, local_path)`` pairs.
 
+        With ``concurrency > 1`` the work is split into ``concurrency`` groups,
+        each transferred by its own worker thread over its own SFTP channel of
+        the one SSH connection, so per-file round-trips overlap instead of
+        adding up. Within a group, small files are fetched with their
+        requests interleaved.
+        """
+        self._require_proposal()
+        self._require_sftp()
+        pairs = list(pairs)
+        # one makedirs per distinct directory, not per file
+        for d in {os.path.dirname(os.path.abspath(local)) for _, local in pairs}:
+            os.makedirs(d, exist_ok=True)
+        self._transfer_many(self._download_group, pairs, concurrency)
+
+    def upload_many(self, pairs: Iterable[Tuple[str, str]], concurrency: int = 8) -> None:
+        """Upload many ``(local_path, remote_path)`` pairs, see :py:meth:`download_many`."""
+        self._transfer_many(self._upload_group, list(pairs), concurrency)
+
+    def _download_one(self, sftp: paramiko.SFTPClient, remote_path: str, local_path: str) -> None:
         os.makedirs(os.path.dirname(os.path.abspath(local_path)), exist_ok=True)
-        sftp.get(_join_posix(self._propdir, remote_path), local_path)
+        _get_pipelined(sftp, self._remote(remote_path), local_path, self._bucket)
         log.info("Downloaded %s → %s", remote_path, local_path)
 
+    def _upload_one(self, sftp: paramiko.SFTPClient, local_path: str, remote_path: str) -> None:
+        full = self._remote(remote_path)
+        _put_pipelined(sftp, local_path, full, self._bucket)
+        self._dir_cache.pop(posixpath.dirname(full), None)
+        self._disk_entries.pop(posixpath.dirname(full), None)
+        log.info("Uploaded %s → %s", local_path, remote_path)
+
+    def _download_group(self, sftp: paramiko.SFTPClient, pairs: List[Tuple[str, str]]) -> None:
+        full = [(self._remote(r), l) for r, l in pairs]
+        sizes = self._cached_sizes(remote for remote, _ in full)
+        for remote, local in _pipelined_small_file_fetch(sftp, full, bucket=self._bucket,
+                                                         sizes=sizes):
+            _get_pipelined(sftp, remote, local, self._bucket)
+            log.info("Downloaded %s → %s", remote, local)
+
+    def _cached_sizes(self, remotes: Iterable[str]) -> Dict[str, int]:
+        """Sizes of absolute *remotes* found in fresh cached listings (no round-trips)."""
+        now = time.monotonic()
+        listings: Dict[str, Dict[str, paramiko.SFTPAttributes]] = {}
+        sizes: Dict[str, int] = {}
+        for remote in remotes:
+            parent, name = posixpath.split(remote)
+            if parent not in listings:
+                hit = self._dir_cache.get(parent)
+                fresh = hit is not None and now - hit[0] < self.cache_ttl
+                listings[parent] = {a.filename: a for a in hit[1]} if fresh else {}
+            attr = listings[parent].get(name)
+            if attr is not None and attr.st_size is not None and not S_ISLNK(attr.st_mode or 0):
+                sizes[remote] = attr.st_size
+        return sizes
+
+    def _upload_group(self, sftp: paramiko.SFTPClient, pairs: List[Tuple[str, str]]) -> None:
+        for local, remote in pairs:
+            self._upload_one(sftp, local, remote)
+
+    def _transfer_many(self, transfer_group, pairs: List[Tuple[str, str]], concurrency: int) -> None:
+        self._require_proposal()
+        sftp = self._require_sftp()
+
+        if concurrency <= 1 or len(pairs) <= 1:
+            transfer_group(sftp, pairs)
+            return
+
+        groups = _chunk(pairs, concurrency)
+        channels: "queue.Queue[paramiko.SFTPClient]" = queue.Queue()
+
+        def worker(group: List[Tuple[str, str]]) -> None:
+            conn = channels.get()
+            try:
+                transfer_group(conn, group)
+            finally:
+                channels.put(conn)
+
+        try:
+            for _ in groups:
+                channels.put(self._spawn_channel())
+            with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+                for future in [pool.submit(worker, g) for g in groups]:
+                    future.result()  # re-raise the first worker error
+        finally:
+            while not channels.empty():
+                channels.get_nowait().close()
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Iterable, Optional, Tuple
+
+from .exceptions import IllDataError, NoProposalSelectedError, NotConnectedError
+from .sftp import _join_posix
+
+log = logging.getLogger(__name__)
+
+# AsyncSSH defaults: up to 128 outstanding 16 KiB requests per transfer
+MAX_REQUESTS = 128
+BLOCK_SIZE = 16384
+
+
+@dataclass
+class AsyncIllSftp:
+    """
+    Asyncio flavour of :class:`~illdata.IllSftp`, implemented with **AsyncSSH**.
+
+    AsyncSSH keeps many SFTP requests in flight per transfer and does its
+    crypto in C (via ``cryptography``), so a single channel gets much closer
+    to link speed than Paramiko. Requires the optional dependency
+    (``pip install illdata[async]``).
+
+    Example
+    -------
+    >>> from illdata import AsyncIllSftp
+    >>> async with AsyncIllSftp("host", "user", "pass") as s:
+    ...     async for p in s.proposals():
+    ...         print(p)
+    ...     await s.open_proposal("12345")
+    ...     await s.download("remote/file.dat", "local/file.dat")
+    """
+
+    hostname: str
+    username: str
+    password: str
+    port: int = 22
+    known_hosts_path: Optional[str] = None  # optional file for strict host-key checking
+
+    _known_hosts: Any = field(default=None, init=False, repr=False)
+    _conn: Any = field(default=None, init=False, repr=False)
+    _sftp: Any = field(default=None, init=False, repr=False)
+    _home: str = field(default="", init=False, repr=False)
+    _proposal: str = field(default="", init=False, repr=False)
+    _propdir: str = field(default="", init=False, repr=False)
+
+    # ------------------------------------------------------------------ context
+    async def __aenter__(self) -> "AsyncIllSftp":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.disconnect()
+        return None  # do not suppress exceptions
+
+    # ------------------------------------------------------------------ helpers
+    @property
+    def connected(self) -> bool:
+        """Whether an SFTP session is active."""
+        return self._sftp is not None
+
+    @property
+    def proposal(self) -> str:
+        """Currently opened proposal ID (or empty string)."""
+        return self._proposal
+
+    # ------------------------------------------------------------------ connect
+    async def connect(self) -> None:
+        """Establish an SSH connection + SFTP session and resolve the *MyData* link."""
+        if self.connected:
+            return
+
+        try:
+            import asyncssh
+        except ImportError as err:
+            raise IllDataError(
+                "AsyncIllSftp requires asyncssh: pip install illdata[async]"
+            ) from err
+
+        try:
+            if self.known_hosts_path and self._known_hosts is None:
+                # parse known_hosts once per instance, reused on every reconnect
+                self._known_hosts = asyncssh.read_known_hosts(self.known_hosts_path)
+
+            # SECURITY: known_hosts=None disables host-key checking, as IllSftp does
+            self._conn = await asyncssh.connect(
+                self.hostname,
+                port=self.port,
+                username=self.username,
+                password=self.password,
+                known_hosts=self._known_hosts,
+                client_keys=None,
+                agent_path=None,
+            )
+            self._sftp = await self._conn.start_sftp_client()
+
+            # resolve MyData symlink
+            self._home = await self._sftp.readlink("MyData")
+            log.info("Connected to %s as %s, home=%s", self.hostname, self.username, self._home)
+
+        except Exception as err:                       # noqa: BLE001
+            await self.disconnect()
+            raise IllDataError(f"Cannot connect to SFTP: {err}") from err
+
+    async def disconnect(self) -> None:
+        """Close SFTP session and SSH connection."""
+        if self._sftp:
+            self._sftp.exit()
+            self._sftp = None
+        if self._conn:
+            self._conn.close()
+            await self._conn.wait_closed()
+            self._conn = None
+            log.info("Disconnected from %s", self.hostname)
+
+    # ------------------------------------------------------------------ guards
+    def _require_sftp(self):
+        if not self._sftp:
+            raise NotConnectedError("Call connect() first or use an async with-block.")
+        return self._sftp
+
+    def _require_proposal(self) -> None:
+        if not self._proposal:
+            raise NoProposalSelectedError("Open a proposal first: open_proposal('12345').")
+
+    # ------------------------------------------------------------------ API
+    async def proposals(self) -> AsyncGenerator[str, None]:
+        """Yield IDs of all available proposals (strip ``exp_`` prefix)."""
+        sftp = self._require_sftp()
+        for name in await sftp.listdir(_join_posix(self._home, "byProposal")):
+            if name in (".", ".."):
+                continue
+            yield name.removeprefix("exp_")
+
+    async def open_proposal(self, value: str) -> None:
+        """Select a proposal (e.g. ``'12345'``)."""
+        sftp = self._require_sftp()
+        self._proposal = value
+        self._propdir = await sftp.readlink(_join_posix(self._home, "byProposal", "exp_" + value))
+
+    async def listdir(self, remote_path: str = "."):
+        """List file names within the current proposal."""
+        self._require_proposal()
+        sftp = self._require_sftp()
+        names = await sftp.listdir(_join_posix(self._propdir, remote_path))
+        return [n for n in names if n not in (".", "..")]
+
+    # ------------- file transfer -----------------------------------------
+    async def download(self, remote_path: str, local_path: str,
+                       max_requests: int = MAX_REQUESTS, block_size: int = BLOCK_SIZE) -> None:
+        """Download `remote_path` (inside the proposal) to `local_path`."""
+        self._require_proposal()
+        self._require_sftp()
+
+        os.makedirs(os.path.dirname(os.path.abspath(local_path)), exist_ok=True)
+        await self._download(remote_path, local_path, max_requests, block_size)
+
+    async def _download(self, remote_path: str, local_path: str,
+                        max_requests: int = MAX_REQUESTS, block_size: int = BLOCK_SIZE) -> None:
+        """:py:meth:`download` into an existing local directory."""
+        await self._require_sftp().get(_join_posix(self._propdir, remote_path), local_path,
+                                       max_requests=max_requests, block_size=block_size)
+        log.info("Downloaded %s → %s", remote_path, local_path)
+
+    async def upload(self, local_path: str, remote_path: str,
+                     max_requests: int = MAX_REQUESTS, block_size: int = BLOCK_SIZE) -> None:
+        """Upload `local_path` to `remote_path` (inside the proposal)."""
+        self._require_proposal()
+        sftp = self._require_sftp()
+
+        await sftp.put(local_path, _join_posix(self._propdir, remote_path),
+                       max_requests=max_requests, block_size=block_size)
+        log.info("Uploaded %s → %s", local_path, remote_path)
+
+    async def download_many(self, pairs: Iterable[Tuple[str, str]], concurrency: int = 8) -> None:
+        """
+        Download many ``(remote_path, local_path)`` pairs.
+
+        All transfers share the one SFTP channel; up to ``concurrency`` of
+        them run at once, each with its own window of pipelined requests.
+        """
+        self._require_proposal()
+        self._require_sftp()
+        pairs = list(pairs)
+        # one makedirs per distinct directory, not per file
+        for d in {os.path.dirname(os.path.abspath(local)) for _, local in pairs}:
+            os.makedirs(d, exist_ok=True)
+        sem = asyncio.Semaphore(max(1, concurrency))
+
+        async def one(remote: str, local: str) -> None:
+            async with sem:
+                await self._download(remote, local)
+
+        await asyncio.gather(*(one(r, l) for r, l in pairs))
+
+    async def upload_many(self, pairs: Iterable[Tuple[str, str]], concurrency: int = 8) -> None:
+        """Upload many ``(local_path, remote_path)`` pairs, see :py:meth:`download_many`."""
+        sem = asyncio.Semaphore(max(1, concurrency))
+
+        async def one(local: str, remote: str) -> None:
+            async with sem:
+                await self.upload(local, remote)
+
+        await asyncio.gather(*(one(l, r) for l, r in pairs))
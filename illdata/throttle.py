@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import BinaryIO, Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting throughput to ``rate_bps`` bytes per second.
+
+    ``consume(n)`` may take more than is available; the bucket then goes into
+    debt and the caller sleeps until it is paid off, so chunks larger than
+    ``burst`` are still throttled correctly. One bucket can be shared by
+    several transfer threads to cap their combined rate.
+    """
+
+    def __init__(self, rate_bps: float, burst: Optional[float] = None) -> None:
+        if rate_bps <= 0:
+            raise ValueError("rate_bps must be positive")
+        self.rate = float(rate_bps)
+        self.burst = float(rate_bps if burst is None else burst)
+        self._tokens = self.burst
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, n: int) -> None:
+        """Take *n* bytes worth of tokens, sleeping if the rate is exceeded."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            self._tokens -= n
+            wait = -self._tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+
+
+class RateLimitedReader:
+    """Wrap a binary file object so that ``read()`` is throttled by a :class:`TokenBucket`."""
+
+    def __init__(self, fileobj: BinaryIO, bucket: TokenBucket) -> None:
+        self._fileobj = fileobj
+        self._bucket = bucket
+
+    def read(self, n: int = -1) -> bytes:
+        data = self._fileobj.read(n)
+        self._bucket.consume(len(data))
+        return data
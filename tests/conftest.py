@@ -0,0 +1,197 @@
+"""In-process SFTP server (Paramiko over a socketpair) serving a temporary directory."""
+import os
+import socket
+import threading
+
+import paramiko
+import pytest
+
+from illdata import IllSftp
+
+
+class _Server(paramiko.ServerInterface):
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_auth_password(self, username, password):
+        return paramiko.AUTH_SUCCESSFUL
+
+    def check_channel_request(self, kind, chanid):
+        return paramiko.OPEN_SUCCEEDED
+
+
+OPEN_HANDLES = set()    # server-side handles the client has not closed yet
+
+
+class _Handle(paramiko.SFTPHandle):
+    def stat(self):
+        return paramiko.SFTPAttributes.from_stat(os.fstat(self.readfile.fileno()))
+
+    def close(self):
+        OPEN_HANDLES.discard(self)
+        super().close()
+
+
+class _StubSFTP(paramiko.SFTPServerInterface):
+    """Maps server paths onto *root*; symlinks below *root* are reported as server paths."""
+
+    def __init__(self, server, root):
+        super().__init__(server)
+        self.root = root
+
+    def _real(self, path):
+        return self.root + self.canonicalize(path)
+
+    def _error(self, err):
+        return paramiko.SFTPServer.convert_errno(err.errno)
+
+    def list_folder(self, path):
+        real = self._real(path)
+        try:
+            out = []
+            for name in os.listdir(real):
+                attr = paramiko.SFTPAttributes.from_stat(os.lstat(os.path.join(real, name)))
+                attr.filename = name
+                out.append(attr)
+            return out
+        except OSError as err:
+            return self._error(err)
+
+    def stat(self, path):
+        try:
+            return paramiko.SFTPAttributes.from_stat(os.stat(self._real(path)))
+        except OSError as err:
+            return self._error(err)
+
+    def lstat(self, path):
+        try:
+            return paramiko.SFTPAttributes.from_stat(os.lstat(self._real(path)))
+        except OSError as err:
+            return self._error(err)
+
+    def readlink(self, path):
+        try:
+            target = os.readlink(self._real(path))
+        except OSError as err:
+            return self._error(err)
+        if target.startswith(self.root):
+            target = target[len(self.root):] or "/"
+        return target
+
+    def open(self, path, flags, attr):
+        real = self._real(path)
+        try:
+            fd = os.open(real, flags | getattr(os, "O_BINARY", 0), 0o666)
+        except OSError as err:
+            return self._error(err)
+        if flags & os.O_WRONLY:
+            mode = "ab" if flags & os.O_APPEND else "wb"
+        elif flags & os.O_RDWR:
+            mode = "a+b" if flags & os.O_APPEND else "r+b"
+        else:
+            mode = "rb"
+        f = os.fdopen(fd, mode)
+        handle = _Handle(flags)
+        handle.filename = real
+        handle.readfile = f
+        handle.writefile = f
+        OPEN_HANDLES.add(handle)
+        return handle
+
+    def mkdir(self, path, attr):
+        try:
+            os.mkdir(self._real(path))
+        except OSError as err:
+            return self._error(err)
+        return paramiko.SFTP_OK
+
+
+@pytest.fixture
+def open_handles():
+    """Live set of server-side handles not closed yet."""
+    OPEN_HANDLES.clear()
+    return OPEN_HANDLES
+
+
+@pytest.fixture
+def calls():
+    """``calls(ill, "stat")`` records the arguments of every ``ill._sftp.stat`` call."""
+    def spy(ill, name):
+        seen = []
+        real = getattr(ill._sftp, name)
+        setattr(ill._sftp, name, lambda *a: seen.append(a) or real(*a))
+        return seen
+    return spy
+
+
+@pytest.fixture(scope="session")
+def host_key():
+    return paramiko.RSAKey.generate(2048)
+
+
+@pytest.fixture
+def server_root(tmp_path):
+    """
+    Server tree: ``/MyData -> /home``, ``/home/byProposal/exp_<id> -> /data/<id>``
+    for proposals ``1`` to ``3``; ``/data/1`` is where tests put their files.
+    """
+    root = tmp_path / "srv"
+    (root / "home" / "byProposal").mkdir(parents=True)
+    os.symlink(str(root / "home"), str(root / "MyData"))
+    for pid in ("1", "2", "3"):
+        (root / "data" / pid).mkdir(parents=True)
+        os.symlink(str(root / "data" / pid), str(root / "home" / "byProposal" / ("exp_" + pid)))
+    return root
+
+
+class _Client:
+    """Stands in for :class:`paramiko.SSHClient`, already connected to the stub server."""
+
+    def __init__(self, transport):
+        self._transport = transport
+
+    def get_transport(self):
+        return self._transport
+
+    def open_sftp(self):
+        return paramiko.SFTPClient.from_transport(self._transport)
+
+    def close(self):
+        self._transport.close()
+
+
+def _serve(root, host_key, servers):
+    s_sock, c_sock = socket.socketpair()
+    server = paramiko.Transport(s_sock)
+    server.add_server_key(host_key)
+    server.set_subsystem_handler("sftp", paramiko.SFTPServer, _StubSFTP, str(root))
+    server.start_server(threading.Event(), _Server())
+    servers.append(server)
+
+    client = paramiko.Transport(c_sock)
+    client.connect(username="user", password="pass")
+    return _Client(client)
+
+
+@pytest.fixture
+def connect(server_root, host_key):
+    """Factory: ``connect(**kwargs)`` returns a connected :class:`IllSftp` talking to the stub server."""
+    clients, servers = [], []
+
+    def factory(**kwargs):
+        ill = IllSftp("localhost", "user", "pass", **kwargs)
+        ill._open_client = lambda: _serve(server_root, host_key, servers)
+        ill.connect()
+        clients.append(ill)
+        return ill
+
+    yield factory
+    for ill in clients:
+        ill.disconnect()
+    for server in servers:
+        server.close()
+
+
+@pytest.fixture
+def ill(connect):
+    return connect()
@@ -0,0 +1,60 @@
+import pytest
+
+
+@pytest.fixture
+def data(server_root):
+    d = server_root / "data" / "1"
+    (d / "a.dat").write_bytes(b"x" * 100)
+    (d / "sub").mkdir()
+    return d
+
+
+@pytest.fixture
+def opened(ill, data):
+    ill.open_proposal("1")
+    return ill
+
+
+def test_stat_served_from_parent_listing(calls, opened):
+    listings, stats = calls(opened, "listdir_attr"), calls(opened, "stat")
+    assert opened.stat("a.dat").st_size == 100
+    assert opened.stat("./sub").filename == "sub"
+    assert len(listings) == 1
+    assert not stats
+
+
+def test_stat_missing_name(opened):
+    with pytest.raises(FileNotFoundError) as exc:
+        opened.stat("nope.dat")
+    assert exc.value.filename == "nope.dat"
+
+
+def test_refresh_drops_listing(calls, opened, data):
+    listings = calls(opened, "listdir_attr")
+    opened.listdir()
+    (data / "b.dat").write_bytes(b"")
+    assert "b.dat" not in opened.listdir()
+    opened.refresh(".")
+    assert "b.dat" in opened.listdir()
+    opened.refresh()
+    opened.listdir()
+    assert len(listings) == 3
+
+
+def test_upload_invalidates_parent_listing(opened, tmp_path):
+    local = tmp_path / "up.dat"
+    local.write_bytes(b"u" * 10)
+    assert "up.dat" not in opened.listdir("sub")
+    opened.upload(str(local), "sub/up.dat")
+    assert opened.stat("sub/up.dat").st_size == 10
+
+
+def test_listing_expires_after_ttl(calls, opened, data):
+    listings = calls(opened, "listdir_attr")
+    opened.listdir()
+    opened.listdir()
+    assert len(listings) == 1
+    opened.cache_ttl = 0
+    (data / "a.dat").write_bytes(b"x" * 7)
+    assert opened.stat("a.dat").st_size == 7
+    assert len(listings) == 2
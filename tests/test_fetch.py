@@ -0,0 +1,77 @@
+import os
+
+import pytest
+
+from illdata.exceptions import NoProposalSelectedError
+from illdata.sftp import _SMALL_FILE_MAX, _SMALL_READ, _pipelined_small_file_fetch
+
+SIZES = {"empty": 0, "block": _SMALL_READ, "limit": _SMALL_FILE_MAX, "big": _SMALL_FILE_MAX + 1}
+
+
+@pytest.fixture
+def files(server_root):
+    for name, size in SIZES.items():
+        (server_root / "data" / "1" / name).write_bytes(os.urandom(size))
+    return server_root / "data" / "1"
+
+
+def _pairs(tmp_path, names):
+    return [("/data/1/" + n, str(tmp_path / "out" / n)) for n in names]
+
+
+def test_fetch_sizes(ill, files, tmp_path, open_handles):
+    (tmp_path / "out").mkdir()
+    too_big = _pipelined_small_file_fetch(ill._sftp, _pairs(tmp_path, SIZES))
+
+    assert too_big == _pairs(tmp_path, ["big"])
+    for name in ("empty", "block", "limit"):
+        assert (tmp_path / "out" / name).read_bytes() == (files / name).read_bytes()
+    assert not (tmp_path / "out" / "big").exists()
+    assert not open_handles
+
+
+def test_fetch_known_size_skips_big_file(ill, files, tmp_path):
+    (tmp_path / "out").mkdir()
+    pairs = _pairs(tmp_path, ["big"])
+    assert _pipelined_small_file_fetch(ill._sftp, pairs, sizes={pairs[0][0]: SIZES["big"]}) == pairs
+
+
+def test_fetch_falls_back_when_file_grew(ill, files, tmp_path, open_handles):
+    (tmp_path / "out").mkdir()
+    pairs = _pairs(tmp_path, ["big"])
+    # stale size: the file is read until it exceeds the limit, then handed back
+    assert _pipelined_small_file_fetch(ill._sftp, pairs, sizes={pairs[0][0]: 10}) == pairs
+    assert not open_handles
+
+
+def test_fetch_missing_file_closes_other_handles(ill, files, tmp_path, open_handles):
+    (tmp_path / "out").mkdir()
+    pairs = _pairs(tmp_path, ["empty", "block", "missing", "limit"])
+    with pytest.raises(FileNotFoundError) as exc:
+        _pipelined_small_file_fetch(ill._sftp, pairs)
+    assert exc.value.filename == "/data/1/missing"
+    assert not open_handles
+
+
+def test_download_many_large_file_into_new_dir(ill, files, tmp_path):
+    ill.open_proposal("1")
+    for concurrency in (1, 2):
+        out = tmp_path / f"new{concurrency}" / "sub"
+        ill.download_many([(n, str(out / n)) for n in SIZES], concurrency=concurrency)
+        for name in SIZES:
+            assert (out / name).read_bytes() == (files / name).read_bytes()
+
+
+def test_cached_sizes_come_from_fresh_listings(ill, files):
+    ill.open_proposal("1")
+    assert ill._cached_sizes(["/data/1/big"]) == {}
+    ill.listdir_attr()
+    assert ill._cached_sizes(["/data/1/big", "/data/1/nope"]) == {"/data/1/big": SIZES["big"]}
+    ill.cache_ttl = 0
+    assert ill._cached_sizes(["/data/1/big"]) == {}
+
+
+def test_download_many_needs_proposal_before_creating_dirs(ill, tmp_path):
+    with pytest.raises(NoProposalSelectedError):
+        ill.download_many([("a.dat", str(tmp_path / "new" / "a.dat"))])
+    assert not (tmp_path / "new").exists()
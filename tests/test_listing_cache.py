@@ -0,0 +1,92 @@
+import json
+import os
+import time
+
+import pytest
+
+OLD = time.time() - 3600
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    # autouse: set up before `connect`, so its final save still lands here
+    home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(home))
+    return home / "illdata" / "localhost"
+
+
+@pytest.fixture
+def data(server_root):
+    d = server_root / "data" / "1"
+    (d / "a.dat").write_bytes(b"x" * 100)
+    (d / "b.dat").write_bytes(b"y")
+    os.utime(d, (OLD, OLD))
+    return d
+
+
+def _session(connect, **kwargs):
+    ill = connect(persist_cache=True, **kwargs)
+    ill.open_proposal("1")
+    return ill
+
+
+def test_not_persisted_by_default(connect, cache_home, data):
+    ill = connect()
+    ill.open_proposal("1")
+    ill.listdir()
+    ill.disconnect()
+    assert not cache_home.exists()
+
+
+def test_names_saved_and_reused(calls, connect, cache_home, data):
+    ill = _session(connect)
+    assert sorted(ill.listdir()) == ["a.dat", "b.dat"]
+    ill.disconnect()
+    saved = json.loads((cache_home / "1.json").read_text())
+    assert sorted(saved["names"]["/data/1"][1]) == ["a.dat", "b.dat"]
+
+    ill = _session(connect)
+    listings = calls(ill, "listdir_attr")
+    assert sorted(ill.listdir()) == ["a.dat", "b.dat"]
+    assert not listings
+
+
+def test_changed_dir_is_listed_again(connect, cache_home, data):
+    ill = _session(connect)
+    ill.listdir()
+    ill.disconnect()
+
+    (data / "c.dat").write_bytes(b"z")
+    os.utime(data, (OLD + 1, OLD + 1))
+    ill = _session(connect)
+    assert sorted(ill.listdir()) == ["a.dat", "b.dat", "c.dat"]
+
+
+def test_recently_changed_dir_is_not_saved(connect, cache_home, data):
+    os.utime(data)      # now: a change within the same second could go unnoticed
+    ill = _session(connect)
+    ill.listdir()
+    ill.disconnect()
+    assert json.loads((cache_home / "1.json").read_text())["names"] == {}
+
+
+def test_attributes_never_come_from_disk(connect, cache_home, data):
+    ill = _session(connect)
+    assert ill.stat("a.dat").st_size == 100
+    ill.disconnect()
+
+    with open(data / "a.dat", "ab") as f:
+        f.write(b"x" * 5000)
+    os.utime(data, (OLD, OLD))      # appending leaves the dir mtime alone
+    ill = _session(connect)
+    assert ill.stat("a.dat").st_size == 5100
+    assert {a.filename: a.st_size for a in ill.listdir_attr()}["a.dat"] == 5100
+
+
+def test_corrupt_cache_file_is_ignored(connect, cache_home, data):
+    cache_home.mkdir(parents=True)
+    (cache_home / "1.json").write_text("{not json")
+    ill = _session(connect)
+    assert sorted(ill.listdir()) == ["a.dat", "b.dat"]
+    ill.disconnect()
+    assert json.loads((cache_home / "1.json").read_text())["propdir"] == "/data/1"
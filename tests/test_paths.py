@@ -0,0 +1,30 @@
+import pytest
+
+from illdata import IllSftp
+from illdata.sftp import _join_posix
+
+
+@pytest.fixture
+def ill():
+    s = IllSftp("host", "user", "pass")
+    s._proposal = "12345"
+    s._propdir = "/data/exp/12345"
+    s._propdir_prefix = "/data/exp/12345/"
+    return s
+
+
+@pytest.mark.parametrize("path, expected", [
+    (".", "/data/exp/12345"),
+    ("", "/data/exp/12345"),
+    ("./x", "/data/exp/12345/x"),
+    (".hidden", "/data/exp/12345/.hidden"),
+    ("..x", "/data/exp/12345/..x"),
+    ("a/", "/data/exp/12345/a"),
+    ("sub/.", "/data/exp/12345/sub"),
+    ("a//b", "/data/exp/12345/a/b"),
+    ("/x", "/x"),
+])
+def test_remote(ill, path, expected):
+    assert ill._remote(path) == expected
+    # must stay equivalent to the PurePosixPath join it replaces
+    assert ill._remote(path) == _join_posix(ill._propdir, path)
@@ -0,0 +1,87 @@
+import os
+import threading
+
+
+def test_proposals(ill):
+    assert sorted(ill.proposals()) == ["1", "2", "3"]
+
+
+def test_client_usable_inside_proposals_loop(ill):
+    seen = {}
+
+    def browse():
+        for p in ill.proposals():
+            ill.open_proposal(p)
+            seen[p] = ill.listdir(".")
+
+    t = threading.Thread(target=browse, daemon=True)
+    t.start()
+    t.join(30)
+    assert not t.is_alive(), "proposals() blocked a client call made inside the loop"
+    assert sorted(seen) == ["1", "2", "3"]
+
+
+def test_proposals_reuses_listing_channel(ill):
+    list(ill.proposals())
+    channel = ill._list_sftp
+    assert sorted(ill.proposals()) == ["1", "2", "3"]
+    assert ill._list_sftp is channel
+
+
+def test_abandoned_proposals_loop_leaves_client_usable(ill):
+    it = ill.proposals()
+    next(it)
+    it.close()
+    assert ill._list_sftp is None
+    assert sorted(ill.proposals()) == ["1", "2", "3"]
+
+
+def test_nested_proposals_loops(ill):
+    pairs = [(a, b) for a in ill.proposals() for b in ill.proposals()]
+    assert len(pairs) == 9
+
+
+def test_one_off_open_proposal_costs_one_readlink(calls, ill):
+    readlinks = calls(ill, "readlink")
+    ill.open_proposal("2")
+    assert ill._propdir == "/data/2"
+    assert len(readlinks) == 1
+    assert ill._proposal_targets is None
+
+
+def test_proposal_map_built_while_browsing(calls, ill):
+    list(ill.proposals())
+    readlinks = calls(ill, "readlink")
+    ill.open_proposal("1")
+    ill.open_proposal("3")
+    assert ill._propdir == "/data/3"
+    assert ill._proposal_targets == {"1": "/data/1", "2": "/data/2", "3": "/data/3"}
+    assert not readlinks
+
+
+def test_proposal_missing_from_map_falls_back_to_readlink(calls, ill, server_root):
+    list(ill.proposals())
+    ill.open_proposal("1")
+    (server_root / "data" / "4").mkdir()
+    os.symlink(str(server_root / "data" / "4"),
+               str(server_root / "home" / "byProposal" / "exp_4"))
+    readlinks = calls(ill, "readlink")
+    ill.open_proposal("4")
+    assert ill._propdir == "/data/4"
+    assert len(readlinks) == 1
+
+
+def test_expired_proposals_listing_is_not_reused(connect):
+    ill = connect(cache_ttl=0)
+    list(ill.proposals())
+    ill.open_proposal("1")
+    assert ill._proposal_targets is None
+
+
+def test_proposal_map_reset_on_reconnect(ill):
+    list(ill.proposals())
+    ill.open_proposal("1")
+    assert ill._proposal_targets is not None
+    ill.disconnect()
+    ill.connect()
+    assert ill._proposal_targets is None
@@ -0,0 +1,18 @@
+import io
+import time
+
+from illdata.throttle import RateLimitedReader, TokenBucket
+
+
+def test_bucket_throttles_beyond_burst():
+    bucket = TokenBucket(rate_bps=1000, burst=0)
+    start = time.monotonic()
+    bucket.consume(100)
+    assert time.monotonic() - start >= 0.09
+
+
+def test_reader_passes_data_through():
+    reader = RateLimitedReader(io.BytesIO(b"abcdef"), TokenBucket(rate_bps=1e9))
+    assert reader.read(4) == b"abcd"
+    assert reader.read(4) == b"ef"
+    assert reader.read(4) == b""
@@ -0,0 +1,66 @@
+import os
+
+import pytest
+
+
+@pytest.fixture
+def opened(ill, server_root):
+    ill.open_proposal("1")
+    return ill
+
+
+@pytest.fixture
+def channels(opened):
+    """Every extra SFTP channel opened by the transfer workers."""
+    opened_channels = []
+    spawn = opened._spawn_channel
+
+    def record():
+        channel = spawn()
+        opened_channels.append(channel)
+        return channel
+
+    opened._spawn_channel = record
+    return opened_channels
+
+
+def _files(root, n):
+    contents = {f"f{i}.dat": os.urandom(1000 * i) for i in range(n)}
+    for name, data in contents.items():
+        (root / name).write_bytes(data)
+    return contents
+
+
+def test_download_many_concurrent(opened, channels, server_root, tmp_path):
+    contents = _files(server_root / "data" / "1", 7)
+    opened.download_many([(n, str(tmp_path / "out" / n)) for n in contents], concurrency=3)
+
+    for name, data in contents.items():
+        assert (tmp_path / "out" / name).read_bytes() == data
+    assert len(channels) == 3
+    assert all(c.sock.closed for c in channels)
+
+
+def test_upload_many_concurrent(opened, channels, server_root, tmp_path):
+    contents = _files(tmp_path, 5)
+    opened.upload_many([(str(tmp_path / n), n) for n in contents], concurrency=2)
+
+    for name, data in contents.items():
+        assert (server_root / "data" / "1" / name).read_bytes() == data
+    assert len(channels) == 2
+    assert all(c.sock.closed for c in channels)
+
+
+def test_worker_error_propagates(opened, channels, server_root, tmp_path):
+    contents = _files(server_root / "data" / "1", 4)
+    pairs = [(n, str(tmp_path / "out" / n)) for n in [*contents, "missing.dat"]]
+    with pytest.raises(FileNotFoundError):
+        opened.download_many(pairs, concurrency=2)
+    assert channels and all(c.sock.closed for c in channels)
+    assert sorted(opened.proposals()) == ["1", "2", "3"]   # main channel unaffected
+
+
+def test_concurrency_one_uses_main_channel(opened, channels, server_root, tmp_path):
+    contents = _files(server_root / "data" / "1", 3)
+    opened.download_many([(n, str(tmp_path / n)) for n in contents], concurrency=1)
+    assert not channels